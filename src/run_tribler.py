@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-import argparse
-import asyncio
-import encodings.idna  # noqa: F401 (https://github.com/pyinstaller/pyinstaller/issues/1113)
-import logging.config
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 import typing
 from pathlib import Path
 
+if getattr(sys, "frozen", False):
+    import encodings.idna  # noqa: F401 (https://github.com/pyinstaller/pyinstaller/issues/1113)
+
 logger = logging.getLogger(__name__)
 
+# The environment is fixed for the lifetime of the process, read it once.
+_APPDATA = os.environ.get("APPDATA", "~")
+_TSTATEDIR = os.environ.get("TSTATEDIR", "state_directory")
+_CORE_API_PORT = os.environ.get("CORE_API_PORT", "-1")
+_CORE_API_KEY = os.environ.get("CORE_API_KEY")
+
 
 class Arguments(typing.TypedDict):
     """
@@ -22,10 +31,29 @@ class Arguments(typing.TypedDict):
     log_level: str
 
 
+def _sniff_mode(argv: list[str]) -> Arguments | None:
+    """
+    Interpret the common command lines (an optional torrent and/or ``--core``) without constructing an argument parser.
+
+    Returns ``None`` if the full argument parser is needed, e.g., for ``--help`` or unknown arguments.
+    """
+    flags = [arg for arg in argv if arg.startswith("-")]
+    positionals = [arg for arg in argv if not arg.startswith("-")]
+    if any(flag != "--core" for flag in flags) or len(positionals) > 1:
+        return None
+    return Arguments(torrent=positionals[0] if positionals else "", core="--core" in flags, log_level="INFO")
+
+
 def parse_args() -> Arguments:
     """
     Parse the command-line arguments.
     """
+    sniffed = _sniff_mode(sys.argv[1:])
+    if sniffed is not None:
+        return sniffed
+
+    import argparse
+
     parser = argparse.ArgumentParser(prog='Tribler [Experimental]', description='Run Tribler BitTorrent client')
     parser.add_argument('torrent', help='torrent file to download', default='', nargs='?')
     parser.add_argument('--core', action="store_true", help="run core process")
@@ -34,30 +62,46 @@ def parse_args() -> Arguments:
     return vars(parser.parse_args())
 
 
-def get_root_state_directory(requested_path: os.PathLike | None) -> Path:
+def get_root_state_directory(requested_path: str | os.PathLike) -> Path:
     """
     Get the default application state directory.
     """
-    root_state_dir = (Path(requested_path) if os.path.isabs(requested_path)
-                      else (Path(os.environ.get("APPDATA", "~")) / ".TriblerExperimental").expanduser().absolute())
+    root_state_dir = Path(requested_path)
+    if not root_state_dir.is_absolute():
+        # The expanded home directory (or APPDATA) is already absolute.
+        root_state_dir = (Path(_APPDATA) / ".TriblerExperimental").expanduser()
     root_state_dir.mkdir(parents=True, exist_ok=True)
     return root_state_dir
 
 
+def configure_logging(level: int | str) -> None:
+    """
+    Log to stdout from a background thread, so that logging calls only have to enqueue their records.
+    """
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 def main() -> None:
     """
     The main script entry point for either the GUI or the core process.
     """
-    asyncio.set_event_loop(asyncio.SelectorEventLoop())
-
     parsed_args = parse_args()
-    logging.basicConfig(level=parsed_args["log_level"], stream=sys.stdout)
+    configure_logging(parsed_args["log_level"])
     logger.info("Run Tribler: %s", parsed_args)
 
-    root_state_dir = get_root_state_directory(os.environ.get('TSTATEDIR', 'state_directory'))
+    root_state_dir = get_root_state_directory(_TSTATEDIR)
     logger.info("Root state dir: %s", root_state_dir)
 
-    api_port, api_key = int(os.environ.get('CORE_API_PORT', '-1')), os.environ.get('CORE_API_KEY')
+    api_port, api_key = int(_CORE_API_PORT), _CORE_API_KEY
 
     # Check whether we need to start the core or the user interface
     if parsed_args["core"]:
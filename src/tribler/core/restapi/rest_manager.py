@@ -23,6 +23,8 @@ from tribler.core.restapi.rest_endpoint import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from aiohttp.abc import Request
 
     from tribler.tribler_config import TriblerConfigManager
@@ -131,6 +133,13 @@ class RESTManager:
         self.root_endpoint.add_endpoint(endpoint.path, endpoint)
         return endpoint
 
+    def add_endpoints(self, endpoints: Iterable[RESTEndpoint]) -> None:
+        """
+        Add multiple REST endpoints to the root endpoint.
+        """
+        for endpoint in endpoints:
+            self.add_endpoint(endpoint)
+
     def get_endpoint(self, name: str) -> RESTEndpoint:
         """
         Get an endpoint by its name, including the first forward slash.
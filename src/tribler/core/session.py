@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-from asyncio import Event
-from contextlib import contextmanager, nullcontext
+from asyncio import Future, gather, get_running_loop
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Generator
 
 from ipv8.loader import IPv8CommunityLoader
@@ -42,23 +42,24 @@ def rust_enhancements(session: Session) -> Generator[None, None, None]:
     """
     Attempt to import the IPv8 Rust anonymization backend.
     """
+    interfaces = {ifc["interface"]: ifc for ifc in session.config.configuration["ipv8"]["interfaces"]}
+    udp_ipv4 = interfaces.get("UDPIPv4")
     try:
         from ipv8.messaging.interfaces.dispatcher.endpoint import INTERFACES
         from ipv8_rust_tunnels.endpoint import RustEndpoint
         INTERFACES["UDPIPv4"] = RustEndpoint
-        for ifc in session.config.configuration["ipv8"]["interfaces"]:
-            if ifc["interface"] == "UDPIPv4":
-                ifc["worker_threads"] = session.config.get("tunnel_community/max_circuits")
+        if udp_ipv4 is not None:
+            udp_ipv4["worker_threads"] = session.config.get("tunnel_community/max_circuits")
         yield
-        if any(nif["interface"] == "UDPIPv4" for nif in session.config.get("ipv8/interfaces")):
+        if udp_ipv4 is not None:
+            ipv4_endpoint = session.ipv8.endpoint.interfaces["UDPIPv4"]
+            rust_endpoint = ipv4_endpoint if isinstance(ipv4_endpoint, RustEndpoint) else None
             for server in session.socks_servers:
-                ipv4_endpoint = session.ipv8.endpoint.interfaces["UDPIPv4"]
-                server.rust_endpoint = ipv4_endpoint if isinstance(ipv4_endpoint, RustEndpoint) else None
+                server.rust_endpoint = rust_endpoint
     except ImportError:
         logger.info("Rust endpoint not found (pip install ipv8-rust-tunnels).")
-        for ifc in session.config.configuration["ipv8"]["interfaces"]:
-            if ifc["interface"] == "UDPIPv4":
-                ifc.pop("worker_threads")
+        if udp_ipv4 is not None:
+            udp_ipv4.pop("worker_threads")
         yield
 
 
@@ -73,7 +74,7 @@ class Session:
         """
         self.config = config
 
-        self.shutdown_event = Event()
+        self.shutdown_future: Future[None] | None = None
         self.notifier = Notifier()
 
         # Libtorrent
@@ -81,8 +82,12 @@ class Session:
         self.socks_servers = [Socks5Server(port) for port in self.config.get("libtorrent/socks_listen_ports")]
 
         # IPv8
-        with nullcontext() if self.config.get("statistics") else rust_enhancements(self):
-            self.ipv8 = IPv8(self.config.get("ipv8"), enable_statistics=self.config.get("statistics"))
+        ipv8_config = self.config.get("ipv8")
+        if self.config.get("statistics"):
+            self.ipv8 = IPv8(ipv8_config, enable_statistics=True)
+        else:
+            with rust_enhancements(self):
+                self.ipv8 = IPv8(ipv8_config, enable_statistics=False)
         self.loader = IPv8CommunityLoader()
 
         # REST
@@ -109,26 +114,39 @@ class Session:
         """
         Register all REST endpoints without initializing them.
         """
-        self.rest_manager.add_endpoint(CreateTorrentEndpoint(self.download_manager))
-        self.rest_manager.add_endpoint(DownloadsEndpoint(self.download_manager))
-        self.rest_manager.add_endpoint(EventsEndpoint(self.notifier))
-        self.rest_manager.add_endpoint(IPv8RootEndpoint()).initialize(self.ipv8)
-        self.rest_manager.add_endpoint(LibTorrentEndpoint(self.download_manager))
-        self.rest_manager.add_endpoint(SettingsEndpoint(self.config))
-        self.rest_manager.add_endpoint(ShutdownEndpoint(self.shutdown_event.set))
-        self.rest_manager.add_endpoint(StatisticsEndpoint(self.ipv8))
-        self.rest_manager.add_endpoint(TorrentInfoEndpoint(self.download_manager))
+        download_manager = self.download_manager
+        ipv8_root_endpoint = IPv8RootEndpoint()
+        self.rest_manager.add_endpoints([
+            CreateTorrentEndpoint(download_manager),
+            DownloadsEndpoint(download_manager),
+            EventsEndpoint(self.notifier),
+            ipv8_root_endpoint,
+            LibTorrentEndpoint(download_manager),
+            SettingsEndpoint(self.config),
+            ShutdownEndpoint(self.request_shutdown),
+            StatisticsEndpoint(self.ipv8),
+            TorrentInfoEndpoint(download_manager)
+        ])
+        ipv8_root_endpoint.initialize(self.ipv8)
+
+    def request_shutdown(self) -> None:
+        """
+        Signal that the session should shut down, e.g., when the user requests it through the REST API.
+        """
+        if self.shutdown_future is not None and not self.shutdown_future.done():
+            self.shutdown_future.set_result(None)
 
     async def start(self) -> None:
         """
         Initialize and launch all components and REST endpoints.
         """
+        self.shutdown_future = get_running_loop().create_future()
+
         # REST (1/2)
         self.register_rest_endpoints()
 
         # Libtorrent
-        for server in self.socks_servers:
-            await server.start()
+        await gather(*(server.start() for server in self.socks_servers))
         self.download_manager.socks_listen_ports = [s.port for s in self.socks_servers]
         self.download_manager.initialize()
         self.download_manager.start()
@@ -147,29 +165,23 @@ class Session:
         """
         Shut down all connections and components.
         """
-        # Stop network event generators
+        notify = self.notifier.notify
+        notify(Notification.tribler_shutdown_state, state="Shutting down.")
+
+        # Stop network event generators and libtorrent managers, these can be torn down independently
+        shutdowns = [self.download_manager.shutdown(), *(server.stop() for server in self.socks_servers)]
         if self.torrent_checker:
-            self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down torrent checker.")
-            await self.torrent_checker.shutdown()
+            shutdowns.append(self.torrent_checker.shutdown())
         if self.ipv8:
-            self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down IPv8 peer-to-peer overlays.")
-            await self.ipv8.stop()
-
-        # Stop libtorrent managers
-        self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down download manager.")
-        await self.download_manager.shutdown()
-        self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down local SOCKS5 interface.")
-        for server in self.socks_servers:
-            await server.stop()
+            shutdowns.append(self.ipv8.stop())
+        await gather(*shutdowns)
 
         # Stop database activities
         if self.db:
-            self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down general-purpose database.")
             self.db.shutdown()
         if self.mds:
-            self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down metadata database.")
             self.mds.shutdown()
 
         # Stop communication with the GUI
-        self.notifier.notify(Notification.tribler_shutdown_state, state="Shutting down GUI connection. Going dark.")
+        notify(Notification.tribler_shutdown_state, state="Shutting down GUI connection. Going dark.")
         await self.rest_manager.stop()
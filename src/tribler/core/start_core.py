@@ -19,7 +19,7 @@ async def run_session(config: TriblerConfigManager) -> None:
     """
     session = Session(config)
     await session.start()
-    await session.shutdown_event.wait()
+    await session.shutdown_future
     await session.shutdown()
 
 
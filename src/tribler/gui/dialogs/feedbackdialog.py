@@ -7,6 +7,7 @@ import time
 from typing import Any, Optional, TYPE_CHECKING
 
 from PyQt5 import uic
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QAction, QDialog, QMessageBox
 
 from tribler.gui.tribler_action_menu import TriblerActionMenu
@@ -32,12 +33,17 @@ def dump(obj: Optional[Any], indent: int = 0) -> str:
         joined = ',\n'.join(strings)
         return f"\n{joined}\n{ind}"
 
-    if isinstance(obj, dict):
+    obj_type = type(obj)
+    if obj_type is not dict and obj_type is not list and obj_type is not tuple:
+        # Subclasses, e.g., OrderedDict, are formatted like their base type
+        obj_type = next((base for base in (dict, tuple, list) if isinstance(obj, base)), None)
+
+    if obj_type is dict:
         items = (f"{ind}  {repr(k)}: {dump(v, indent + 2)}" for k, v in obj.items())
         return f'{{{join(items)}}}'
 
-    if isinstance(obj, (list, tuple)):
-        closing = ['(', ')'] if isinstance(obj, tuple) else ['[', ']']
+    if obj_type is list or obj_type is tuple:
+        closing = ['(', ')'] if obj_type is tuple else ['[', ']']
         items = (f"{ind}  {dump(x, indent + 2)}" for x in obj)
         return f'{closing[0]}{join(items)}{closing[1]}'
 
@@ -84,6 +90,23 @@ class FeedbackDialog(QDialog):
         self.tribler_version = tribler_version
         self.additional_tags = additional_tags or {}
 
+        self.tribler_uptime = time.time() - start_time
+
+        # Show the stacktrace right away and collect the system information once the dialog is shown
+        self.info = None
+        self.update_error_text()
+        QTimer.singleShot(0, self.build_info)
+
+        placeholder = tr(
+            "What were you doing before this crash happened? "
+            "This information will help Tribler developers to figure out and fix the issue quickly."
+        )
+        self.comments_text_edit.setPlaceholderText(placeholder)
+
+        connect(self.cancel_button.clicked, self.on_cancel_clicked)
+        connect(self.send_report_button.clicked, self.on_send_clicked)
+
+    def build_info(self) -> None:
         self.info = {
             'error text': str(self.reported_error),
             "comments": self.comments_text_edit.toPlainText(),
@@ -94,30 +117,24 @@ class FeedbackDialog(QDialog):
                 'platform.machine': platform.machine(),
                 'python.version': sys.version,
                 'in_debug': str(__debug__),
-                'tribler_uptime': f"{time.time() - start_time}",
+                'tribler_uptime': f"{self.tribler_uptime}",
                 'sys.argv': list(sys.argv),
                 'sys.path': list(sys.path)
             },
-            "environment": os.environ,
+            "environment": dict(os.environ),
             "last processes": [str(p) for p in self.process_manager.get_last_processes()]
         }
+        self.update_error_text()
 
+    def update_error_text(self) -> None:
         text = dump_with_name('Stacktrace', str(self.reported_error), start='')
-        text += dump_with_name('Info', self.info)
-        text += dump_with_name('Additional tags', self.additional_tags)
+        if self.info is not None:
+            text += dump_with_name('Info', self.info)
+            text += dump_with_name('Additional tags', self.additional_tags)
         text = text.replace('\\n', '\n')
         text = self.scrubber.scrub_text(text)
         self.error_text_edit.setPlainText(text)
 
-        placeholder = tr(
-            "What were you doing before this crash happened? "
-            "This information will help Tribler developers to figure out and fix the issue quickly."
-        )
-        self.comments_text_edit.setPlaceholderText(placeholder)
-
-        connect(self.cancel_button.clicked, self.on_cancel_clicked)
-        connect(self.send_report_button.clicked, self.on_send_clicked)
-
     def on_remove_entry(self, index):
         self.env_variables_list.takeTopLevelItem(index)
 
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 
@@ -22,7 +23,7 @@ from tribler.gui.utilities import (
     seconds_to_hhmm_string,
     string_to_seconds,
 )
-from tribler.tribler_config import DEFAULT_CONFIG
+from tribler.tribler_config import get_default_config
 
 
 class SettingsPage(QWidget):
@@ -206,7 +207,7 @@ class SettingsPage(QWidget):
 
     def save_settings(self, checked):
         # Create a dictionary with all available settings
-        settings_data = DEFAULT_CONFIG
+        settings_data = copy.deepcopy(get_default_config())
         settings_data['libtorrent']['download_defaults']['saveas'] = self.window().download_location_input.text()
         settings_data['libtorrent']['proxy_type'] = self.window().lt_proxy_type_combobox.currentIndex()
 
@@ -187,6 +187,21 @@ class TestRESTManager(TestBase):
 
         self.assertEqual(endpoint, manager.get_endpoint("/test"))
 
+    def test_add_endpoints(self) -> None:
+        """
+        Test if multiple endpoints can be added to the RESTManager at once and retrieved again.
+        """
+        manager = RESTManager(MockTriblerConfigManager())
+        endpoint1 = RESTEndpoint()
+        endpoint1.path = "/test1"
+        endpoint2 = RESTEndpoint()
+        endpoint2.path = "/test2"
+
+        manager.add_endpoints([endpoint1, endpoint2])
+
+        self.assertEqual(endpoint1, manager.get_endpoint("/test1"))
+        self.assertEqual(endpoint2, manager.get_endpoint("/test2"))
+
     def test_set_api_port(self) -> None:
         """
         Test if the api port can be set.
@@ -0,0 +1,43 @@
+from collections import OrderedDict, namedtuple
+
+from ipv8.test.base import TestBase
+
+from tribler.gui.dialogs.feedbackdialog import dump
+
+
+class TestDump(TestBase):
+    """
+    Tests for the feedback dialog dump function.
+    """
+
+    def test_dump_nested(self) -> None:
+        """
+        Test if nested values are dumped as indented Python literals.
+        """
+        value = {
+            "error text": 'Traceback (most recent call last):\n  File "/a/b.py", line 3',
+            "tags": (1, None),
+            "enabled": True
+        }
+
+        self.assertEqual("{\n"
+                         "  'error text': 'Traceback (most recent call last):\\n  File \"/a/b.py\", line 3',\n"
+                         "  'tags': (\n"
+                         "    1,\n"
+                         "    None\n"
+                         "  ),\n"
+                         "  'enabled': True\n"
+                         "}", dump(value))
+
+    def test_dump_subclasses(self) -> None:
+        """
+        Test if subclasses of dicts and tuples are dumped like their base types.
+        """
+        point = namedtuple("Point", ["x", "y"])
+
+        self.assertEqual("{\n"
+                         "  'a': (\n"
+                         "    1,\n"
+                         "    2\n"
+                         "  )\n"
+                         "}", dump(OrderedDict(a=point(1, 2))))
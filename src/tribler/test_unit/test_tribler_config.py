@@ -1,6 +1,8 @@
+from pathlib import Path
+
 from ipv8.test.base import TestBase
 
-from tribler.tribler_config import DEFAULT_CONFIG, TriblerConfigManager
+from tribler.tribler_config import TriblerConfigManager, get_default_config
 
 
 class TestTriblerConfigManager(TestBase):
@@ -31,7 +33,7 @@ class TestTriblerConfigManager(TestBase):
         """
         config = TriblerConfigManager()
 
-        self.assertEqual(DEFAULT_CONFIG["api"], config.get("api"))
+        self.assertEqual(get_default_config()["api"], config.get("api"))
 
     def test_get_set_explicit(self) -> None:
         """
@@ -41,3 +43,38 @@ class TestTriblerConfigManager(TestBase):
         config.set("libtorrent/download_defaults/seeding_time", 42)
 
         self.assertEqual(42, config.get("libtorrent/download_defaults/seeding_time"))
+
+    def test_get_unknown(self) -> None:
+        """
+        Test if ``get`` returns None for options that do not exist in the config or the defaults.
+        """
+        config = TriblerConfigManager()
+
+        self.assertIsNone(config.get("libtorrent/download_defaults/does_not_exist"))
+
+    def test_get_default_fallback_unchanged(self) -> None:
+        """
+        Test if setting values in a config without a file does not change the defaults of other configs.
+        """
+        config = TriblerConfigManager()
+        config.get("does_not_exist")
+        config.set("libtorrent/download_defaults/seeding_time", 42)
+        other = TriblerConfigManager()
+        other.configuration = {"libtorrent": {}}
+
+        self.assertEqual(60, other.get("libtorrent/download_defaults/seeding_time"))
+        self.assertEqual(60, other.get("libtorrent/download_defaults")["seeding_time"])
+
+    def test_write_read(self) -> None:
+        """
+        Test if a written config can be loaded again.
+        """
+        config_file = Path(self.temporary_directory()) / "configuration.json"
+        config = TriblerConfigManager(config_file)
+        config.set("libtorrent/download_defaults/seeding_time", 42)
+
+        config.write()
+        loaded = TriblerConfigManager(config_file)
+
+        self.assertEqual(42, loaded.get("libtorrent/download_defaults/seeding_time"))
+        self.assertEqual(config.get("libtorrent"), loaded.get("libtorrent"))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
+import copy
 import logging
 import os
+from functools import lru_cache
 from json import JSONDecodeError
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, Iterator, TypedDict
 
+import orjson
 from ipv8.configuration import default as ipv8_default_config
 
 logger = logging.getLogger(__name__)
@@ -157,72 +159,117 @@ class TriblerConfig(TypedDict):
     memory_db: bool
 
 
-DEFAULT_CONFIG = {
-    "api": {
-        "http_enabled": True,
-        "http_port": 0,
-        "http_host": "127.0.0.1",
-        "https_enabled": False,
-        "https_host": "127.0.0.1",
-        "https_port": 0,
-        "https_certfile": "https_certfile",
-        "refresh_port_on_start": True
-    },
-
-    "ipv8": ipv8_default_config,
-    "statistics": False,
-
-    "content_discovery_community": ContentDiscoveryCommunityConfig(enabled=True),
-    "database": DatabaseConfig(enabled=True),
-    "dht_discovery": DHTDiscoveryCommunityConfig(enabled=True),
-    "knowledge_community": KnowledgeCommunityConfig(enabled=True),
-    "libtorrent": LibtorrentConfig(
-        socks_listen_ports=[0, 0, 0, 0, 0],
-        port=0,
-        proxy_type=0,
-        proxy_server='',
-        proxy_auth='',
-        max_connections_download=-1,
-        max_download_rate=0,
-        max_upload_rate=0,
-        utp=True,
-        dht=True,
-        dht_readiness_timeout=30,
-        upnp=True,
-        natpmp=True,
-        lsd=True,
-        download_defaults=DownloadDefaultsConfig(
-            anonymity_enabled=True,
-            number_hops=1,
-            safeseeding_enabled=True,
-            saveas=str(Path("~/Downloads").expanduser()),
-            seeding_mode='forever',
-            seeding_ratio=2.0,
-            seeding_time=60,
-            channel_download=False,
-            add_download_to_channel=False)
-        ),
-    "rendezvous": RendezvousConfig(enabled=True),
-    "torrent_checker": TorrentCheckerConfig(enabled=True),
-    "tunnel_community": TunnelCommunityConfig(enabled=True, min_circuits=3, max_circuits=8),
-    "user_activity": UserActivityConfig(enabled=True, max_query_history=500, health_check_interval=5.0),
-
-    "state_dir": str((Path(os.environ.get("APPDATA", "~")) / ".TriblerExperimental").expanduser().absolute()),
-    "memory_db": False
-}
-
-# Changes to IPv8 default config
-DEFAULT_CONFIG["ipv8"]["keys"].append({
-    'alias': "secondary",
-    'generation': "curve25519",
-    'file': "secondary_key.pem"
-})
-DEFAULT_CONFIG["ipv8"]["overlays"] = [overlay for overlay in DEFAULT_CONFIG["ipv8"]["overlays"]
-                                      if overlay["class"] == "DiscoveryCommunity"]
-DEFAULT_CONFIG["ipv8"]["working_directory"] = DEFAULT_CONFIG["state_dir"]
-for key_entry in DEFAULT_CONFIG["ipv8"]["keys"]:
-    if "file" in key_entry:
-        key_entry["file"] = str(Path(DEFAULT_CONFIG["state_dir"]) / key_entry["file"])
+@lru_cache(maxsize=None)
+def _default_state_dir() -> str:
+    """
+    Get the default state directory, resolved at most once.
+    """
+    return str((Path(os.environ.get("APPDATA", "~")) / ".TriblerExperimental").expanduser().absolute())
+
+
+@lru_cache(maxsize=None)
+def get_default_config() -> dict:
+    """
+    Get the default configuration, constructed the first time it is requested.
+    """
+    config = {
+        "api": {
+            "http_enabled": True,
+            "http_port": 0,
+            "http_host": "127.0.0.1",
+            "https_enabled": False,
+            "https_host": "127.0.0.1",
+            "https_port": 0,
+            "https_certfile": "https_certfile",
+            "refresh_port_on_start": True
+        },
+
+        "ipv8": ipv8_default_config,
+        "statistics": False,
+
+        "content_discovery_community": ContentDiscoveryCommunityConfig(enabled=True),
+        "database": DatabaseConfig(enabled=True),
+        "dht_discovery": DHTDiscoveryCommunityConfig(enabled=True),
+        "knowledge_community": KnowledgeCommunityConfig(enabled=True),
+        "libtorrent": LibtorrentConfig(
+            socks_listen_ports=[0, 0, 0, 0, 0],
+            port=0,
+            proxy_type=0,
+            proxy_server='',
+            proxy_auth='',
+            max_connections_download=-1,
+            max_download_rate=0,
+            max_upload_rate=0,
+            utp=True,
+            dht=True,
+            dht_readiness_timeout=30,
+            upnp=True,
+            natpmp=True,
+            lsd=True,
+            download_defaults=DownloadDefaultsConfig(
+                anonymity_enabled=True,
+                number_hops=1,
+                safeseeding_enabled=True,
+                saveas=str(Path("~/Downloads").expanduser()),
+                seeding_mode='forever',
+                seeding_ratio=2.0,
+                seeding_time=60,
+                channel_download=False,
+                add_download_to_channel=False)
+            ),
+        "rendezvous": RendezvousConfig(enabled=True),
+        "torrent_checker": TorrentCheckerConfig(enabled=True),
+        "tunnel_community": TunnelCommunityConfig(enabled=True, min_circuits=3, max_circuits=8),
+        "user_activity": UserActivityConfig(enabled=True, max_query_history=500, health_check_interval=5.0),
+
+        "state_dir": _default_state_dir(),
+        "memory_db": False
+    }
+
+    # Changes to IPv8 default config
+    config["ipv8"]["keys"].append({
+        'alias': "secondary",
+        'generation': "curve25519",
+        'file': "secondary_key.pem"
+    })
+    config["ipv8"]["overlays"] = [overlay for overlay in config["ipv8"]["overlays"]
+                                  if overlay["class"] == "DiscoveryCommunity"]
+    config["ipv8"]["working_directory"] = config["state_dir"]
+    state_dir = Path(config["state_dir"])
+    for key_entry in config["ipv8"]["keys"]:
+        if "file" in key_entry:
+            key_entry["file"] = str(state_dir / key_entry["file"])
+    return config
+
+
+def _flatten(tree: dict, prefix: tuple[str, ...] = ()) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """
+    Yield the path and value of every entry in the given tree, including the sub-trees themselves.
+    """
+    for key, value in tree.items():
+        path = (*prefix, key)
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, path)
+
+
+@lru_cache(maxsize=None)
+def _default_flat() -> dict[tuple[str, ...], Any]:
+    """
+    Get the default configuration, flattened into a dict keyed by option path tuples.
+    """
+    return dict(_flatten(get_default_config()))
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _split_option(option: str) -> tuple[str, ...]:
+    """
+    Split a path-like config option descriptor into its parts.
+    """
+    return tuple(option.split("/"))
 
 
 class TriblerConfigManager:
@@ -241,41 +288,42 @@ class TriblerConfigManager:
         self.configuration = {}
         if config_file.exists():
             try:
-                with open(self.config_file) as f:
-                    self.configuration = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    self.configuration = orjson.loads(f.read())
             except JSONDecodeError:
                 logger.exception("Failed to load stored configuration. Falling back to defaults!")
         if not self.configuration:
-            self.configuration = DEFAULT_CONFIG
+            self.configuration = copy.deepcopy(get_default_config())
 
     def write(self) -> None:
         """
         Write the configuration to disk.
         """
-        with open(self.config_file, "w") as f:
-            json.dump(self.configuration, f, indent=4)
+        with open(self.config_file, "wb") as f:
+            f.write(orjson.dumps(self.configuration, option=orjson.OPT_INDENT_2))
 
-    def get(self, option: os.PathLike | str) -> dict | list | str | float | bool | None:
+    def get(self, option: str) -> dict | list | str | float | bool | None:
         """
         Get a config option based on the path-like descriptor.
         """
+        parts = _split_option(option)
         out = self.configuration
-        for part in Path(option).parts:
-            if part in out:
-                out = out.get(part)
-            else:
-                # Fetch from defaults instead.
-                out = DEFAULT_CONFIG
-                for df_part in Path(option).parts:
-                    out = out.get(df_part)
+        for part in parts:
+            out = out.get(part, _MISSING)
+            if out is _MISSING:
                 break
-        return out
+        else:
+            return out
+
+        # Fetch from defaults instead.
+        return _default_flat().get(parts)
 
-    def set(self, option: os.PathLike | str, value: dict | list | str | float | bool | None) -> None:
+    def set(self, option: str, value: dict | list | str | float | bool | None) -> None:
         """
         Set a config option value based on the path-like descriptor.
         """
+        *parents, leaf = _split_option(option)
         current = self.configuration
-        for part in Path(option).parts[:-1]:
+        for part in parents:
             current = current[part]
-        current[Path(option).parts[-1]] = value
+        current[leaf] = value